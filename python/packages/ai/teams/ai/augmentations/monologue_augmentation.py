@@ -5,6 +5,7 @@ Licensed under the MIT License.
 
 from __future__ import annotations
 
+import copy
 import json
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Union, cast
@@ -215,7 +216,7 @@ class MonologueAugmentation(Augmentation[InnerMonologue]):
             parameters = (
                 json.dumps(monologue.action.parameters) if monologue.action.parameters else ""
             )
-            message = Message[str](
+            message: Message[str] = Message(
                 role="assistant",
                 content=None,
                 function_call=FunctionCall(name=monologue.action.name, arguments=parameters),
@@ -250,11 +251,17 @@ class MonologueAugmentation(Augmentation[InnerMonologue]):
         Returns:
             Plan: The created plan.
         """
+        message = response.message
+
         # Identify the action to perform
-        if response.message and response.message.content:
+        if message and message.content:
             command: PredictedCommand
-            # Double encoding/decoding required for class
-            monologue = InnerMonologue.from_dict(InnerMonologue.to_dict(response.message.content))
+            # The validator returns an `InnerMonologue`, only decode content set some other way
+            monologue = (
+                message.content
+                if isinstance(message.content, InnerMonologue)
+                else InnerMonologue.from_dict(InnerMonologue.to_dict(message.content))
+            )
 
             if monologue.action.name == "SAY":
                 params = monologue.action.parameters
@@ -262,7 +269,7 @@ class MonologueAugmentation(Augmentation[InnerMonologue]):
                     response=(
                         Message(
                             role="assistant",
-                            context=response.message.context,
+                            context=message.context,
                             content=params.get("text"),
                         )
                         if params
@@ -271,9 +278,15 @@ class MonologueAugmentation(Augmentation[InnerMonologue]):
                 )
                 command = response_val
             else:
+                # The monologue is also kept in conversation history, so give the action handler
+                # its own copy of the parameters
                 command = PredictedDoCommand(
                     action=monologue.action.name,
-                    parameters=monologue.action.parameters if monologue.action.parameters else {},
+                    parameters=(
+                        copy.deepcopy(monologue.action.parameters)
+                        if monologue.action.parameters
+                        else {}
+                    ),
                 )
             return Plan(commands=[command])
         return Plan()
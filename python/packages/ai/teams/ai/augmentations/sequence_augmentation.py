@@ -13,12 +13,7 @@ from botbuilder.core import TurnContext
 from ...state import MemoryBase
 from ..models.chat_completion_action import ChatCompletionAction
 from ..models.prompt_response import PromptResponse
-from ..planners.plan import (
-    Plan,
-    PredictedCommand,
-    PredictedDoCommand,
-    PredictedSayCommand,
-)
+from ..planners.plan import Plan, PredictedDoCommand, PredictedSayCommand
 from ..prompts.function_call import FunctionCall
 from ..prompts.message import Message
 from ..prompts.sections.action_augmentation_section import ActionAugmentationSection
@@ -124,9 +119,9 @@ class SequenceAugmentation(Augmentation[Plan]):
             for cmd in commands:
                 if cmd["type"] == "SAY":
                     try:
-                        cmd["response"] = Message[str](role="assistant", content=cmd["response"])
+                        cmd["response"] = Message(role="assistant", content=cmd["response"])
                     except KeyError:
-                        cmd["response"] = Message[str](role="assistant")
+                        cmd["response"] = Message(role="assistant")
 
             plan = Plan.from_dict(validation_result.value)
             validation_result.value = plan
@@ -145,7 +140,7 @@ class SequenceAugmentation(Augmentation[Plan]):
                     parameters: str = ""
                     if command.parameters:
                         parameters = json.dumps(command.parameters)
-                    message = Message[str](
+                    message: Message[str] = Message(
                         role="assistant",
                         content=None,
                         function_call=FunctionCall(name=command.action, arguments=parameters),
@@ -174,7 +169,7 @@ class SequenceAugmentation(Augmentation[Plan]):
                         )
 
                     if isinstance(command.response, dict):
-                        command.response = Message[str].from_dict(command.response)
+                        command.response = Message.from_dict(command.response)
                 else:
                     return Validation(
                         valid=False,
@@ -200,24 +195,23 @@ class SequenceAugmentation(Augmentation[Plan]):
             Plan: The created plan
         """
 
-        if response.message and response.message.content:
-            plan = response.message.content
-            commands: List[PredictedCommand] = []
-
-            for command in plan.commands:
-                if command.type == "SAY":
-                    commands.append(
-                        PredictedSayCommand(
-                            response=Message[str](
-                                role="assistant",
-                                context=response.message.context,
-                                content=command.response.content if command.response else None,
-                            )
+        message = response.message
+
+        if message and message.content:
+            plan = message.content
+            plan.commands = [
+                (
+                    PredictedSayCommand(
+                        response=Message(
+                            role="assistant",
+                            context=message.context,
+                            content=command.response.content if command.response else None,
                         )
                     )
-                else:
-                    commands.append(command)
-
-            plan.commands = commands
+                    if command.type == "SAY"
+                    else command
+                )
+                for command in plan.commands
+            ]
             return plan
         return Plan()
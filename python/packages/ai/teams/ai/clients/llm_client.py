@@ -171,7 +171,7 @@ class LLMClient:
                 fork = Memory(memory)
 
                 if self._options.logger:
-                    self._options.logger.info(f"REPAIRING RESPONSE:\n{res.message.content or ''}")
+                    self._options.logger.info("REPAIRING RESPONSE:\n%s", res.message.content or "")
 
                 self._add_message_to_history(
                     fork, f"{self._options.history_variable}-repair", res.message
@@ -192,20 +192,7 @@ class LLMClient:
                     memory=fork,
                     functions=functions,
                     tokenizer=tokenizer,
-                    template=PromptTemplate(
-                        name=template.name,
-                        actions=template.actions,
-                        augmentation=template.augmentation,
-                        config=template.config,
-                        prompt=Prompt(
-                            sections=[
-                                template.prompt,
-                                ConversationHistorySection(
-                                    variable=f"{self._options.history_variable}-repair"
-                                ),
-                            ]
-                        ),
-                    ),
+                    template=self._get_repair_template(template),
                     remaining_attempts=remaining_attempts - 1,
                 )
 
@@ -215,6 +202,32 @@ class LLMClient:
         except Exception as err:  # pylint: disable=broad-except
             return PromptResponse(status="error", error=str(err))
 
+    def _get_repair_template(self, template: PromptTemplate) -> PromptTemplate:
+        variable = f"{self._options.history_variable}-repair"
+        sections = template.prompt.sections if isinstance(template.prompt, Prompt) else []
+
+        # Reuse the template built by a previous repair attempt so the
+        # repair history isn't appended (and rendered) once per attempt
+        if (
+            len(sections) > 0
+            and isinstance(sections[-1], ConversationHistorySection)
+            and sections[-1].variable == variable
+        ):
+            return template
+
+        return PromptTemplate(
+            name=template.name,
+            actions=template.actions,
+            augmentation=template.augmentation,
+            config=template.config,
+            prompt=Prompt(
+                sections=[
+                    template.prompt,
+                    ConversationHistorySection(variable=variable),
+                ]
+            ),
+        )
+
     def _add_message_to_history(
         self, memory: MemoryBase, variable: str, message: Message[Any]
     ) -> None:
@@ -7,8 +7,19 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from logging import Logger
-from typing import Callable, List, Optional, Union
+from logging import DEBUG, Logger
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Union,
+    cast,
+)
 
 import openai
 from botbuilder.core import TurnContext
@@ -22,6 +33,12 @@ from ..tokenizers import Tokenizer
 from .prompt_completion_model import PromptCompletionModel
 from .prompt_response import PromptResponse
 
+if TYPE_CHECKING:
+    import httpx
+
+# Any other role is sent as a `user` message
+_ROLES = frozenset(["user", "assistant", "system"])
+
 
 @dataclass
 class OpenAIModelOptions:
@@ -44,6 +61,17 @@ class OpenAIModelOptions:
     logger: Optional[Logger] = None
     "Optional. When set the model will log requests"
 
+    http_client: Optional[httpx.AsyncClient] = None
+    """Optional. HTTP client to send requests with. Pass the same client to multiple models
+    to share its connection pool.
+    """
+
+    stream: bool = False
+    "Optional. When `True` the completion will be streamed from the API. Defaults to `False`."
+
+    on_chunk: Optional[Callable[[str], Awaitable[None]]] = None
+    "Optional. Called with each text chunk received while the completion is streamed."
+
 
 @dataclass
 class AzureOpenAIModelOptions:
@@ -74,6 +102,17 @@ class AzureOpenAIModelOptions:
     logger: Optional[Logger] = None
     "Optional. When set the model will log requests"
 
+    http_client: Optional[httpx.AsyncClient] = None
+    """Optional. HTTP client to send requests with. Pass the same client to multiple models
+    to share its connection pool.
+    """
+
+    stream: bool = False
+    "Optional. When `True` the completion will be streamed from the API. Defaults to `False`."
+
+    on_chunk: Optional[Callable[[str], Awaitable[None]]] = None
+    "Optional. Called with each text chunk received while the completion is streamed."
+
 
 class OpenAIModel(PromptCompletionModel):
     """
@@ -103,6 +142,7 @@ class OpenAIModel(PromptCompletionModel):
                 base_url=options.endpoint,
                 organization=options.organization,
                 default_headers={"User-Agent": self.user_agent},
+                http_client=options.http_client,
             )
         elif isinstance(options, AzureOpenAIModelOptions):
             self._client = openai.AsyncAzureOpenAI(
@@ -113,6 +153,7 @@ class OpenAIModel(PromptCompletionModel):
                 azure_deployment=options.default_model,
                 organization=options.organization,
                 default_headers={"User-Agent": self.user_agent},
+                http_client=options.http_client,
             )
 
     async def complete_prompt(
@@ -147,46 +188,27 @@ class OpenAIModel(PromptCompletionModel):
             )
 
         if self._options.logger is not None:
-            self._options.logger.debug(f"PROMPT:\n{res.output}")
+            self._options.logger.debug("PROMPT:\n%s", res.output)
 
         messages: List[chat.ChatCompletionMessageParam] = []
 
         for msg in res.output:
-            param: Union[
-                chat.ChatCompletionUserMessageParam,
-                chat.ChatCompletionAssistantMessageParam,
-                chat.ChatCompletionSystemMessageParam,
-            ] = chat.ChatCompletionUserMessageParam(
-                role="user",
-                content=msg.content if msg.content is not None else "",
-            )
+            # Message params are TypedDicts, so build them as plain dicts
+            param: Dict[str, Any] = {
+                "role": msg.role if msg.role in _ROLES else "user",
+                "content": msg.content if msg.content is not None else "",
+            }
 
             if msg.name:
                 param["name"] = msg.name
 
-            if msg.role == "assistant":
-                param = chat.ChatCompletionAssistantMessageParam(
-                    role="assistant",
-                    content=msg.content if msg.content is not None else "",
-                )
-
-                if msg.name:
-                    param["name"] = msg.name
-            elif msg.role == "system":
-                param = chat.ChatCompletionSystemMessageParam(
-                    role="system",
-                    content=msg.content if msg.content is not None else "",
-                )
-
-                if msg.name:
-                    param["name"] = msg.name
-
-            messages.append(param)
+            messages.append(cast(chat.ChatCompletionMessageParam, param))
 
         try:
-            extra_body = {}
+            extra_body = None
             if template.config.completion.data_sources is not None:
-                extra_body["data_sources"] = template.config.completion.data_sources
+                extra_body = {"data_sources": template.config.completion.data_sources}
+
             completion = await self._client.chat.completions.create(
                 messages=messages,
                 model=model,
@@ -196,30 +218,41 @@ class OpenAIModel(PromptCompletionModel):
                 temperature=template.config.completion.temperature,
                 max_tokens=template.config.completion.max_tokens,
                 extra_body=extra_body,
+                stream=self._options.stream,
             )
 
-            if self._options.logger is not None:
-                self._options.logger.debug("COMPLETION:\n%s", completion.model_dump_json())
+            if self._options.stream:
+                message = await self._read_stream(
+                    cast(AsyncIterable[chat.ChatCompletionChunk], completion)
+                )
 
-            input: Optional[Message] = None
-            last_message = len(res.output) - 1
+                if self._options.logger is not None:
+                    self._options.logger.debug("COMPLETION:\n%s", message.content)
+            else:
+                completion = cast(chat.ChatCompletion, completion)
 
-            # Skips the first message which is the prompt
-            if last_message > 0 and res.output[last_message].role == "user":
-                input = res.output[last_message]
+                # Skip serializing the completion unless it will be logged
+                if self._options.logger is not None and self._options.logger.isEnabledFor(DEBUG):
+                    self._options.logger.debug("COMPLETION:\n%s", completion.model_dump_json())
 
-            return PromptResponse[str](
-                input=input,
-                message=Message(
-                    role=completion.choices[0].message.role,
-                    content=completion.choices[0].message.content,
+                choice = completion.choices[0].message
+                message = Message(
+                    role=choice.role,
+                    content=choice.content,
                     context=(
-                        MessageContext.from_dict(completion.choices[0].message.context)
-                        if hasattr(completion.choices[0].message, "context")
+                        MessageContext.from_dict(choice.context)
+                        if hasattr(choice, "context")
                         else None
                     ),
-                ),
-            )
+                )
+
+            input: Optional[Message] = None
+
+            # Skips the first message which is the prompt
+            if len(res.output) > 1 and res.output[-1].role == "user":
+                input = res.output[-1]
+
+            return PromptResponse[str](input=input, message=message)
         except openai.APIError as err:
             if self._options.logger is not None:
                 self._options.logger.error("ERROR:\n%s", json.dumps(err.body))
@@ -231,3 +264,31 @@ class OpenAIModel(PromptCompletionModel):
                 status of {err.code}: {err.message}
                 """,
             )
+
+    async def _read_stream(
+        self, completion: AsyncIterable[chat.ChatCompletionChunk]
+    ) -> Message[str]:
+        role = "assistant"
+        content: List[str] = []
+        context: Optional[MessageContext] = None
+
+        async for chunk in completion:
+            # Azure OpenAI sends content filter results in chunks without choices
+            if len(chunk.choices) == 0:
+                continue
+
+            delta = chunk.choices[0].delta
+
+            if delta.role is not None:
+                role = delta.role
+
+            if hasattr(delta, "context") and context is None:
+                context = MessageContext.from_dict(getattr(delta, "context"))
+
+            if delta.content:
+                content.append(delta.content)
+
+                if self._options.on_chunk is not None:
+                    await self._options.on_chunk(delta.content)
+
+        return Message(role=role, content="".join(content), context=context)
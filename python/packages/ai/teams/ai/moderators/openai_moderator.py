@@ -5,6 +5,7 @@ Licensed under the MIT License.
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import Generic, Literal, Optional, TypeVar
 
@@ -106,29 +107,37 @@ class OpenAIModerator(Generic[StateT], Moderator[StateT]):
         if self._options.moderate == "input":
             return plan
 
-        for cmd in plan.commands:
-            if isinstance(cmd, PredictedSayCommand):
-                try:
-                    res = await self._client.moderations.create(
-                        input=cmd.response.content if cmd.response and cmd.response.content else "",
-                        model=self._options.model,
-                    )
+        # Moderate every SAY command concurrently, then report results in plan order
+        responses = await asyncio.gather(
+            *[
+                self._client.moderations.create(
+                    input=cmd.response.content if cmd.response and cmd.response.content else "",
+                    model=self._options.model,
+                )
+                for cmd in plan.commands
+                if isinstance(cmd, PredictedSayCommand)
+            ],
+            return_exceptions=True,
+        )
 
-                    for result in res.results:
-                        if result.flagged:
-                            return Plan(
-                                commands=[
-                                    PredictedDoCommand(
-                                        action=ActionTypes.FLAGGED_OUTPUT,
-                                        parameters=result.model_dump(),
-                                    )
-                                ]
-                            )
-                except openai.APIError as err:
+        for res in responses:
+            if isinstance(res, openai.APIError):
+                return Plan(
+                    commands=[
+                        PredictedDoCommand(action=ActionTypes.HTTP_ERROR, parameters=res.__dict__)
+                    ]
+                )
+
+            if isinstance(res, BaseException):
+                raise res
+
+            for result in res.results:
+                if result.flagged:
                     return Plan(
                         commands=[
                             PredictedDoCommand(
-                                action=ActionTypes.HTTP_ERROR, parameters=err.__dict__
+                                action=ActionTypes.FLAGGED_OUTPUT,
+                                parameters=result.model_dump(),
                             )
                         ]
                     )
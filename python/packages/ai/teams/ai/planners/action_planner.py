@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from logging import Logger
-from typing import Awaitable, Callable, List, Optional, TypeVar, Union
+from typing import Awaitable, Callable, Dict, List, Optional, TypeVar, Union
 
 from botbuilder.core import TurnContext
 
@@ -64,6 +64,9 @@ class ActionPlanner(Planner[StateT]):
 
     _options: ActionPlannerOptions
     _prompt_factory: ActionPlannerPromptFactory
+    _default_prompt_name: Optional[str]
+    _default_augmentation: DefaultAugmentation
+    _clients: Dict[str, LLMClient]
 
     @property
     def options(self) -> ActionPlannerOptions:
@@ -78,18 +81,26 @@ class ActionPlanner(Planner[StateT]):
         """
 
         self._options = options
+        self._default_augmentation = DefaultAugmentation()
+        self._clients = {}
 
         if isinstance(self._options.default_prompt, str):
+            self._default_prompt_name = self._options.default_prompt
             self._prompt_factory = self._default_prompt_factory(self._options.default_prompt)
         else:
+            self._default_prompt_name = None
             self._prompt_factory = self._options.default_prompt
 
     async def begin_task(self, context: TurnContext, state: TurnState) -> Plan:
         return await self.continue_task(context, state)
 
     async def continue_task(self, context: TurnContext, state: TurnState) -> Plan:
-        template = await self._prompt_factory(context, state, self)
-        augmentation = template.augmentation or DefaultAugmentation()
+        template = (
+            await self._options.prompts.get_prompt(self._default_prompt_name)
+            if self._default_prompt_name is not None
+            else await self._prompt_factory(context, state, self)
+        )
+        augmentation = template.augmentation or self._default_augmentation
         res = await self.complete_prompt(
             context=context, memory=state, prompt=template, validator=augmentation
         )
@@ -129,17 +140,29 @@ class ActionPlanner(Planner[StateT]):
 
         template = await self._options.prompts.get_prompt(name)
         include_history = template.config.completion.include_history
-        client = LLMClient(
-            LLMClientOptions(
-                model=self._options.model,
-                history_variable=(
-                    f"conversation.{name}_history" if include_history else f"temp.{name}_history"
-                ),
-                input_variable="temp.input",
-                validator=validator,
-                logger=self._options.logger,
-            )
+        history_variable = (
+            f"conversation.{name}_history" if include_history else f"temp.{name}_history"
         )
+        client = self._clients.get(name)
+
+        # Reuse the client from the last call to this prompt unless its options changed
+        if (
+            client is None
+            or client.options.history_variable != history_variable
+            or client.options.validator is not validator
+            or client.options.model is not self._options.model
+            or client.options.logger is not self._options.logger
+        ):
+            client = LLMClient(
+                LLMClientOptions(
+                    model=self._options.model,
+                    history_variable=history_variable,
+                    input_variable="temp.input",
+                    validator=validator,
+                    logger=self._options.logger,
+                )
+            )
+            self._clients[name] = client
 
         return await client.complete_prompt(
             context=context,
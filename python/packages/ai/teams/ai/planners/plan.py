@@ -6,7 +6,7 @@ Licensed under the MIT License.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Type, Union
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 
@@ -47,6 +47,11 @@ class PredictedSayCommand(DataClassJsonMixin):
 PredictedCommand = Union[PredictedDoCommand, PredictedSayCommand]
 "A predicted command is a command that the AI system should execute."
 
+_COMMAND_TYPES: Dict[str, Type[PredictedCommand]] = {
+    "DO": PredictedDoCommand,
+    "SAY": PredictedSayCommand,
+}
+
 
 @dataclass
 class Plan:
@@ -64,8 +69,9 @@ class Plan:
     def from_dict(cls, dict: Dict[str, Any], *, infer_missing: bool = False) -> "Plan":
         commands: List[PredictedCommand] = []
         for command in dict["commands"]:
-            if command["type"] == "DO":
-                commands.append(PredictedDoCommand.from_dict(command, infer_missing=infer_missing))
-            if command["type"] == "SAY":
-                commands.append(PredictedSayCommand.from_dict(command, infer_missing=infer_missing))
+            # Pick the command class from its "type" tag, unknown types are skipped
+            command_type = _COMMAND_TYPES.get(command["type"])
+
+            if command_type is not None:
+                commands.append(command_type.from_dict(command, infer_missing=infer_missing))
         return Plan(commands=commands)
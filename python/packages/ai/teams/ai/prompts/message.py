@@ -5,17 +5,17 @@ Licensed under the MIT License.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from typing import Generic, Literal, Optional, TypeVar, Union
+from typing import Any, Dict, Generic, Literal, Optional, TypeVar, Union
 
-from dataclasses_json import DataClassJsonMixin, dataclass_json
+from dataclasses_json import DataClassJsonMixin
 
 from .function_call import FunctionCall
 
 T = TypeVar("T")
 
 
-@dataclass_json
 @dataclass
 class Message(Generic[T], DataClassJsonMixin):
     """
@@ -34,6 +34,64 @@ class Message(Generic[T], DataClassJsonMixin):
     function_call: Optional[FunctionCall] = None
     name: Optional[str] = None
 
+    # Messages are decoded for every history entry and model response, so the fields are
+    # read directly instead of through the dataclasses-json type reflection
+    @classmethod
+    def from_dict(cls, kvs: Any, *, infer_missing=False) -> "Message[T]":
+        if isinstance(kvs, Message):
+            return kvs
+
+        role = kvs.get("role") if infer_missing else kvs["role"]
+        context = kvs.get("context")
+        function_call = kvs.get("function_call")
+
+        return cls(
+            # Decoded strings are not interned, so share the handful of role values
+            role=sys.intern(role) if isinstance(role, str) else role,
+            content=kvs.get("content"),
+            context=(
+                MessageContext.from_dict(context, infer_missing=infer_missing)
+                if context is not None
+                else None
+            ),
+            function_call=(
+                function_call
+                if function_call is None or isinstance(function_call, FunctionCall)
+                else (
+                    FunctionCall(
+                        name=function_call.get("name"), arguments=function_call.get("arguments")
+                    )
+                    if infer_missing
+                    else FunctionCall(
+                        name=function_call["name"], arguments=function_call["arguments"]
+                    )
+                )
+            ),
+            name=kvs.get("name"),
+        )
+
+    def to_dict(self, encode_json=False) -> Dict[str, Any]:
+        # Text messages are built directly, anything else goes through dataclasses-json
+        if (
+            encode_json
+            or not (self.content is None or isinstance(self.content, str))
+            or not (self.context is None or isinstance(self.context, MessageContext))
+            or not (self.function_call is None or isinstance(self.function_call, FunctionCall))
+        ):
+            return super().to_dict(encode_json=encode_json)
+
+        return {
+            "role": self.role,
+            "content": self.content,
+            "context": self.context.to_dict() if self.context is not None else None,
+            "function_call": (
+                {"name": self.function_call.name, "arguments": self.function_call.arguments}
+                if self.function_call is not None
+                else None
+            ),
+            "name": self.name,
+        }
+
 
 @dataclass
 class ImageUrl:
@@ -66,11 +124,15 @@ class ImageContentPart:
     Represents image content part of a message
 
     Attributes:
-        image_url (Union[str, ImageUrl]): Url for the image
+        image_url (ImageUrl): Url for the image. A plain url string is converted to an `ImageUrl`.
     """
 
     type: Literal["image_url"]
-    image_url: Union[str, ImageUrl]
+    image_url: ImageUrl
+
+    def __post_init__(self) -> None:
+        if isinstance(self.image_url, str):
+            self.image_url = ImageUrl(url=self.image_url)
 
 
 MessageContentParts = Union[TextContentPart, ImageContentPart]
@@ -79,7 +141,6 @@ Represents part of the message's content
 """
 
 
-@dataclass_json
 @dataclass
 class Citation(DataClassJsonMixin):
     """
@@ -97,8 +158,38 @@ class Citation(DataClassJsonMixin):
     url: Optional[str]
     filepath: Optional[str]
 
+    @classmethod
+    def from_dict(cls, kvs: Any, *, infer_missing=False) -> "Citation":
+        if isinstance(kvs, Citation):
+            return kvs
+
+        if infer_missing:
+            return cls(
+                content=kvs.get("content"),
+                title=kvs.get("title"),
+                url=kvs.get("url"),
+                filepath=kvs.get("filepath"),
+            )
+
+        return cls(
+            content=kvs["content"],
+            title=kvs["title"],
+            url=kvs["url"],
+            filepath=kvs["filepath"],
+        )
+
+    def to_dict(self, encode_json=False) -> Dict[str, Any]:
+        if encode_json:
+            return super().to_dict(encode_json=encode_json)
+
+        return {
+            "content": self.content,
+            "title": self.title,
+            "url": self.url,
+            "filepath": self.filepath,
+        }
+
 
-@dataclass_json
 @dataclass
 class MessageContext(DataClassJsonMixin):
     """
@@ -111,3 +202,22 @@ class MessageContext(DataClassJsonMixin):
 
     citations: list[Citation]
     intent: str
+
+    @classmethod
+    def from_dict(cls, kvs: Any, *, infer_missing=False) -> "MessageContext":
+        if isinstance(kvs, MessageContext):
+            return kvs
+
+        citations = kvs.get("citations") if infer_missing else kvs["citations"]
+        intent = kvs.get("intent") if infer_missing else kvs["intent"]
+
+        return cls(
+            citations=[Citation.from_dict(c, infer_missing=infer_missing) for c in citations or []],
+            intent=sys.intern(intent) if isinstance(intent, str) else intent,
+        )
+
+    def to_dict(self, encode_json=False) -> Dict[str, Any]:
+        if encode_json or not all(isinstance(c, Citation) for c in self.citations):
+            return super().to_dict(encode_json=encode_json)
+
+        return {"citations": [c.to_dict() for c in self.citations], "intent": self.intent}
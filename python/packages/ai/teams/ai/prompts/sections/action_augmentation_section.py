@@ -110,12 +110,12 @@ class ActionAugmentationSection(PromptSectionBase):
         if len(self._token_list) > max_tokens:
             trimmed = self._token_list[0:max_tokens]
             return RenderedPromptSection[List[Message[str]]](
-                output=[Message[str](role="system", content=tokenizer.decode(trimmed))],
+                output=[Message(role="system", content=tokenizer.decode(trimmed))],
                 length=len(trimmed),
                 too_long=True,
             )
         return RenderedPromptSection[List[Message[str]]](
-            output=[Message[str](role="system", content=self._text)],
+            output=[Message(role="system", content=self._text)],
             length=len(self._token_list),
             too_long=False,
         )
@@ -65,7 +65,7 @@ class DataSourceSection(PromptSectionBase):
         # - The role will typically end up being ignored because as this section is usually added
         #   to a `GroupSection` which will override the role.
         return RenderedPromptSection(
-            output=[Message[str]("system", rendered.output)],
+            output=[Message("system", rendered.output)],
             length=rendered.length,
             too_long=rendered.too_long,
         )
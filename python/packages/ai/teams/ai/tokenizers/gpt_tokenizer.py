@@ -5,7 +5,8 @@ Licensed under the MIT License.
 
 from __future__ import annotations
 
-from typing import List
+from functools import lru_cache
+from typing import Callable, List, Tuple
 
 from tiktoken import Encoding, get_encoding
 
@@ -16,10 +17,20 @@ class GPTTokenizer(Tokenizer):
     """Used to encode and decode text for GPT-3.5/GPT-4 model."""
 
     _encoding: Encoding
+    _encode_cached: Callable[[str], Tuple[int, ...]]
 
-    def __init__(self):
-        """Initializes the GPTTokenizer object."""
+    def __init__(self, cache_size: int = 1024):
+        """Initializes the GPTTokenizer object.
+
+        Args:
+            cache_size (int, optional): Number of encoded strings to cache. Static prompt
+                text is re-encoded on every render, so repeats are served from the cache.
+                Defaults to `1024`.
+        """
         self._encoding = get_encoding("cl100k_base")
+        self._encode_cached = lru_cache(maxsize=cache_size)(
+            lambda text: tuple(self._encoding.encode(text))
+        )
 
     def decode(self, tokens: List[int]) -> str:
         """Decodes a list of tokens into a string.
@@ -41,4 +52,4 @@ class GPTTokenizer(Tokenizer):
         Returns:
             List[int]: The list of encoded tokens.
         """
-        return self._encoding.encode(text)
+        return list(self._encode_cached(text))
@@ -42,7 +42,8 @@ class ActionResponseValidator(PromptResponseValidator):
     Default response validator that always returns true.
     """
 
-    _actions: Dict[str, ChatCompletionAction] = {}
+    _actions: Dict[str, ChatCompletionAction]
+    _validators: Dict[str, JSONResponseValidator]
     _required: bool
     _noun: str
 
@@ -60,10 +61,26 @@ class ActionResponseValidator(PromptResponseValidator):
 
         self._required = required
         self._noun = noun
+        self._actions = {}
+        self._validators = {}
 
         for action in actions:
             self._actions[action.name] = action
 
+            if action.parameters is not None:
+                self._validators[action.name] = JSONResponseValidator(
+                    schema=action.parameters,
+                    missing_json_feedback=(
+                        f"No arguments were sent with called {noun}. "
+                        f'Call the "{action.name}" {noun} with required '
+                        "arguments as a valid JSON object."
+                    ),
+                    error_feedback=(
+                        f"The {noun} arguments had errors. "
+                        f'Apply these fixes and call "{action.name}" {noun} again:'
+                    ),
+                )
+
     @property
     def actions(self) -> List[ChatCompletionAction]:
         """
@@ -114,22 +131,9 @@ class ActionResponseValidator(PromptResponseValidator):
             )
 
         params: Dict[str, Any] = {}
-        action = self._actions[func.name]
-
-        if action.parameters is not None:
-            validator = JSONResponseValidator(
-                schema=action.parameters,
-                missing_json_feedback=(
-                    f"No arguments were sent with called {self._noun}. "
-                    f'Call the "{func.name}" {self._noun} with required '
-                    "arguments as a valid JSON object."
-                ),
-                error_feedback=(
-                    f"The {self._noun} arguments had errors. "
-                    f'Apply these fixes and call "{func.name}" {self._noun} again:'
-                ),
-            )
+        validator = self._validators.get(func.name)
 
+        if validator is not None:
             res = await validator.validate_response(
                 context=context,
                 memory=memory,
@@ -8,7 +8,10 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional
 
 from botbuilder.core import TurnContext
-from jsonschema import ValidationError, validate
+from jsonschema import ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 
 from ...state import MemoryBase
 from ...utils.json import parse
@@ -26,6 +29,7 @@ class JSONResponseValidator(PromptResponseValidator):
     """
 
     _schema: Optional[Dict[str, Any]]
+    _validator: Optional[Validator]
     _missing_json_feedback: str
     _error_feedback: str
 
@@ -41,6 +45,8 @@ class JSONResponseValidator(PromptResponseValidator):
 
         super().__init__()
         self._schema = schema
+        self._validator = None
+
         self._missing_json_feedback = (
             missing_json_feedback
             if missing_json_feedback is not None
@@ -95,15 +101,22 @@ class JSONResponseValidator(PromptResponseValidator):
         if self._schema is None:
             return Validation(value=parsed.pop())
 
+        # Check and compile the schema on first use rather than on every validation
+        if self._validator is None:
+            cls = validator_for(self._schema)
+            cls.check_schema(self._schema)
+            self._validator = cls(self._schema)
+
         parsed.reverse()
         errors: List[str] = []
 
         for obj in parsed:
-            try:
-                validate(instance=obj, schema=self._schema)
+            error: Optional[ValidationError] = best_match(self._validator.iter_errors(obj))
+
+            if error is None:
                 return Validation(value=obj)
-            except ValidationError as err:
-                errors.append(err.message)
+
+            errors.append(error.message)
 
         return Validation(
             valid=False, feedback=f"{self._error_feedback}{NEW_LINE}{NEW_LINE.join(errors)}"
@@ -5,6 +5,7 @@ Licensed under the MIT License.
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any, Generic, Optional, TypeVar, cast
 
 from botbuilder.core import Storage, TurnContext
@@ -68,9 +69,12 @@ class TurnState(MemoryBase, State, Generic[ConversationStateT, UserStateT, TempS
     async def load(
         cls, context: TurnContext, storage: Optional[Storage] = None
     ) -> "TurnState[ConversationStateT, UserStateT, TempStateT]":
-        conversation = await ConversationState.load(context, storage)
-        user = await UserState.load(context, storage)
-        temp = await TempState.load(context, storage)
+        # Read the scopes concurrently so remote storage round trips overlap
+        conversation, user, temp = await asyncio.gather(
+            ConversationState.load(context, storage),
+            UserState.load(context, storage),
+            TempState.load(context, storage),
+        )
 
         return cls(
             conversation=cast(ConversationStateT, conversation),
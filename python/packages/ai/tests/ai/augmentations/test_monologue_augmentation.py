@@ -172,3 +172,18 @@ class TestMonologueAugmentation(IsolatedAsyncioTestCase):
         assert isinstance(plan.commands[0], PredictedDoCommand)
         self.assertEqual(plan.commands[0].action, "test")
         self.assertEqual(plan.commands[0].parameters.get("foo"), "bar")
+
+    async def test_create_plan_with_do_command_copies_parameters(self):
+        state = TurnState()
+        monologue = InnerMonologue(
+            thoughts=Thoughts(thought="test", reasoning="test", plan="test"),
+            action=Action(name="test", parameters={"foo": {"bar": "baz"}}),
+        )
+        plan = await self.monologue_augmentation.create_plan_from_response(
+            cast(TurnContext, {}),
+            state,
+            PromptResponse[InnerMonologue](message=Message(role="assistant", content=monologue)),
+        )
+        assert isinstance(plan.commands[0], PredictedDoCommand)
+        plan.commands[0].parameters["foo"]["bar"] = "changed"
+        self.assertEqual(monologue.action.parameters, {"foo": {"bar": "baz"}})
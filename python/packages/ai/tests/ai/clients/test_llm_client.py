@@ -3,11 +3,12 @@ Copyright (c) Microsoft Corporation. All rights reserved.
 Licensed under the MIT License.
 """
 
-from typing import cast
+from typing import Any, Dict, List, cast
 from unittest import IsolatedAsyncioTestCase, mock
 
 import httpx
 import openai
+from botbuilder.core import TurnContext
 from openai.types import chat
 
 from teams.ai.clients.llm_client import LLMClient, LLMClientOptions
@@ -19,8 +20,10 @@ from teams.ai.prompts.prompt_functions import PromptFunctions
 from teams.ai.prompts.prompt_template import PromptTemplate
 from teams.ai.prompts.prompt_template_config import PromptTemplateConfig
 from teams.ai.prompts.sections.text_section import TextSection
+from teams.ai.tokenizers import Tokenizer
 from teams.ai.tokenizers.gpt_tokenizer import GPTTokenizer
-from teams.state import TurnState
+from teams.ai.validators import PromptResponseValidator, Validation
+from teams.state import MemoryBase, TurnState
 from teams.state.conversation_state import ConversationState
 from teams.state.temp_state import TempState
 from teams.state.user_state import UserState
@@ -55,6 +58,16 @@ class MockAsyncCompletions:
         )
 
 
+class MockRecordingAsyncCompletions(MockAsyncCompletions):
+    def __init__(self) -> None:
+        super().__init__()
+        self.sent_messages: List[List[Dict[str, Any]]] = []
+
+    async def create(self, **kwargs) -> chat.ChatCompletion:
+        self.sent_messages.append(kwargs["messages"])
+        return await super().create(**kwargs)
+
+
 class MockAsyncChat:
     completions: MockAsyncCompletions
 
@@ -70,6 +83,24 @@ class MockAsyncOpenAIError:
     chat = MockAsyncChat(should_error=True)
 
 
+class MockFailingValidator(PromptResponseValidator):
+    def __init__(self, feedback: List[str]) -> None:
+        self.feedback = feedback
+
+    async def validate_response(
+        self,
+        context: TurnContext,
+        memory: MemoryBase,
+        tokenizer: Tokenizer,
+        response: PromptResponse,
+        remaining_attempts: int,
+    ) -> Validation:
+        if len(self.feedback) > 0:
+            return Validation(valid=False, feedback=self.feedback.pop(0))
+
+        return Validation()
+
+
 class TestLLMClient(IsolatedAsyncioTestCase):
     def create_mock_context(
         self, channel_id="channel1", bot_id="bot1", conversation_id="conversation1", user_id="user1"
@@ -204,3 +235,42 @@ class TestLLMClient(IsolatedAsyncioTestCase):
             self.assertEqual(response.message.content, "test")
 
         self.assertEqual(state.get(client.options.history_variable), expected_history)
+
+    async def test_complete_prompt_renders_repair_history_once(self):
+        context = self.create_mock_context()
+        state = await TurnState[ConversationState, UserState, TempState].load(context)
+        completions = MockRecordingAsyncCompletions()
+        mock_client = mock.MagicMock()
+        mock_client.chat.completions = completions
+
+        with mock.patch("openai.AsyncOpenAI", return_value=mock_client):
+            model = OpenAIModel(OpenAIModelOptions(api_key="", default_model="model"))
+
+        client = LLMClient(
+            LLMClientOptions(model, validator=MockFailingValidator(["fix 1", "fix 2"]))
+        )
+        response = await client.complete_prompt(
+            context=context,
+            memory=state,
+            functions=cast(PromptFunctions, {}),
+            tokenizer=GPTTokenizer(),
+            template=PromptTemplate(
+                name="default",
+                prompt=TextSection(text="this is a test prompt", role="system", tokens=1),
+                config=PromptTemplateConfig(
+                    schema=1.0,
+                    type="completion",
+                    description="test",
+                    completion=CompletionConfig(completion_type="chat"),
+                ),
+            ),
+            remaining_attempts=3,
+        )
+
+        self.assertEqual(response.status, "success")
+        self.assertEqual(len(completions.sent_messages), 3)
+
+        contents = [msg["content"] for msg in completions.sent_messages[-1]]
+
+        self.assertEqual(sum("fix 1" in content for content in contents), 1)
+        self.assertEqual(sum("fix 2" in content for content in contents), 1)
@@ -3,7 +3,7 @@ Copyright (c) Microsoft Corporation. All rights reserved.
 Licensed under the MIT License.
 """
 
-from typing import cast
+from typing import AsyncIterator, List, cast
 from unittest import IsolatedAsyncioTestCase, mock
 
 import httpx
@@ -51,6 +51,25 @@ class MockAsyncCompletions:
         )
 
 
+class MockAsyncStreamCompletions:
+    async def create(self, **kwargs) -> AsyncIterator[chat.ChatCompletionChunk]:
+        async def stream():
+            for delta in [
+                chat.chat_completion_chunk.ChoiceDelta(role="assistant"),
+                chat.chat_completion_chunk.ChoiceDelta(content="te"),
+                chat.chat_completion_chunk.ChoiceDelta(content="st"),
+            ]:
+                yield chat.ChatCompletionChunk(
+                    id="",
+                    choices=[chat.chat_completion_chunk.Choice(index=0, delta=delta)],
+                    created=0,
+                    model=kwargs["model"],
+                    object="chat.completion.chunk",
+                )
+
+        return stream()
+
+
 class MockAsyncChat:
     completions: MockAsyncCompletions
 
@@ -58,6 +77,10 @@ class MockAsyncChat:
         self.completions = MockAsyncCompletions(should_error=should_error)
 
 
+class MockAsyncStreamChat:
+    completions = MockAsyncStreamCompletions()
+
+
 class MockAsyncOpenAI:
     chat = MockAsyncChat()
 
@@ -70,6 +93,10 @@ class MockAsyncOpenAIError:
     chat = MockAsyncChat(should_error=True)
 
 
+class MockAsyncOpenAIStream:
+    chat = MockAsyncStreamChat()
+
+
 class TestOpenAIModel(IsolatedAsyncioTestCase):
     def create_mock_context(
         self, channel_id="channel1", bot_id="bot1", conversation_id="conversation1", user_id="user1"
@@ -87,6 +114,18 @@ class TestOpenAIModel(IsolatedAsyncioTestCase):
         self.assertTrue(mock_async_openai.called)
         self.assertTrue(isinstance(model._client, MockAsyncOpenAI))
 
+    @mock.patch("openai.AsyncOpenAI", spec=MockAsyncOpenAI)
+    async def test_should_share_http_client(self, mock_async_openai):
+        http_client = httpx.AsyncClient()
+        OpenAIModel(OpenAIModelOptions(api_key="", default_model="a", http_client=http_client))
+        OpenAIModel(OpenAIModelOptions(api_key="", default_model="b", http_client=http_client))
+        self.assertEqual(mock_async_openai.call_count, 2)
+
+        for call in mock_async_openai.call_args_list:
+            self.assertIs(call.kwargs["http_client"], http_client)
+
+        await http_client.aclose()
+
     @mock.patch("openai.AsyncAzureOpenAI", spec=MockAsyncAzureOpenAI)
     async def test_should_be_azure_openai(self, mock_async_openai):
         model = OpenAIModel(AzureOpenAIModelOptions(api_key="", default_model="model", endpoint=""))
@@ -146,3 +185,41 @@ class TestOpenAIModel(IsolatedAsyncioTestCase):
 
         self.assertTrue(mock_async_openai.called)
         self.assertEqual(res.status, "success")
+
+    @mock.patch("openai.AsyncOpenAI", return_value=MockAsyncOpenAIStream)
+    async def test_should_stream(self, mock_async_openai):
+        context = self.create_mock_context()
+        state = TurnState()
+        await state.load(context)
+        chunks: List[str] = []
+
+        async def on_chunk(chunk: str) -> None:
+            chunks.append(chunk)
+
+        model = OpenAIModel(
+            OpenAIModelOptions(api_key="", default_model="model", stream=True, on_chunk=on_chunk)
+        )
+        res = await model.complete_prompt(
+            context=context,
+            memory=state,
+            functions=cast(PromptFunctions, {}),
+            tokenizer=GPTTokenizer(),
+            template=PromptTemplate(
+                name="default",
+                prompt=TextSection(text="this is a test prompt", role="system", tokens=1),
+                config=PromptTemplateConfig(
+                    schema=1.0,
+                    type="completion",
+                    description="test",
+                    completion=CompletionConfig(completion_type="chat"),
+                ),
+            ),
+        )
+
+        self.assertTrue(mock_async_openai.called)
+        self.assertEqual(res.status, "success")
+        self.assertEqual(chunks, ["te", "st"])
+        self.assertIsNotNone(res.message)
+        if res.message is not None:
+            self.assertEqual(res.message.role, "assistant")
+            self.assertEqual(res.message.content, "test")
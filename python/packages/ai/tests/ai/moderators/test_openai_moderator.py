@@ -120,6 +120,38 @@ class MockAsyncModerationsRateLimited:
         )
 
 
+class MockAsyncModerationsByInput:
+    inputs: List[Union[str, List[str]]]
+
+    def __init__(self) -> None:
+        self.inputs = []
+
+    async def create(
+        self,
+        *,
+        input: Union[str, List[str]],
+        model: Union[
+            str, Literal["text-moderation-latest", "text-moderation-stable"]
+        ] = "text-moderation-latest",
+        extra_headers: Optional[openai._types.Headers] = None,
+        extra_query: Optional[openai._types.Query] = None,
+        extra_body: Optional[openai._types.Body] = None,
+        timeout: Union[
+            float, httpx.Timeout, None, openai._types.NotGiven
+        ] = openai._types.NOT_GIVEN,
+    ) -> openai.types.ModerationCreateResponse:
+        # pylint: disable=unused-argument
+        self.inputs.append(input)
+
+        if input == "flagged":
+            return await MockAsyncModerationsWithResults().create(input=input, model=model)
+
+        if input == "error":
+            return await MockAsyncModerationsRateLimited().create(input=input, model=model)
+
+        return await MockAsyncModerations().create(input=input, model=model)
+
+
 class MockAsyncOpenAI:
     moderations = MockAsyncModerations()
 
@@ -219,3 +251,28 @@ class TestOpenAIModerator(IsolatedAsyncioTestCase):
         self.assertEqual(output.commands[0].type, "DO")
         assert isinstance(output.commands[0], PredictedDoCommand)
         self.assertEqual(output.commands[0].action, ActionTypes.HTTP_ERROR)
+
+    async def test_should_review_output_in_plan_order(self):
+        moderations = MockAsyncModerationsByInput()
+        client = mock.MagicMock()
+        client.moderations = moderations
+        moderator = OpenAIModerator(
+            options=OpenAIModeratorOptions(api_key="", moderate="output"),
+            client=cast(openai.AsyncOpenAI, client),
+        )
+        context = self.create_mock_context()
+        state = await TurnState[ConversationState, UserState, TempState].load(context)
+        plan = Plan(
+            commands=[
+                PredictedSayCommand(response=Message[str](role="assistant", content="test")),
+                PredictedSayCommand(response=Message[str](role="assistant", content="flagged")),
+                PredictedSayCommand(response=Message[str](role="assistant", content="error")),
+            ]
+        )
+        output = await moderator.review_output(context=context, state=state, plan=plan)
+        self.assertEqual(moderations.inputs, ["test", "flagged", "error"])
+        assert output is not None
+        self.assertEqual(len(output.commands), 1)
+        self.assertEqual(output.commands[0].type, "DO")
+        assert isinstance(output.commands[0], PredictedDoCommand)
+        self.assertEqual(output.commands[0].action, ActionTypes.FLAGGED_OUTPUT)
@@ -0,0 +1,101 @@
+"""
+Copyright (c) Microsoft Corporation. All rights reserved.
+Licensed under the MIT License.
+"""
+
+from unittest import IsolatedAsyncioTestCase, mock
+
+from botbuilder.core import TurnContext
+
+from teams.ai.models import PromptCompletionModel, PromptResponse
+from teams.ai.planners import ActionPlanner, ActionPlannerOptions
+from teams.ai.prompts import (
+    CompletionConfig,
+    Message,
+    PromptFunctions,
+    PromptManager,
+    PromptManagerOptions,
+    PromptTemplate,
+    PromptTemplateConfig,
+    TextSection,
+)
+from teams.ai.tokenizers import Tokenizer
+from teams.ai.validators import DefaultResponseValidator
+from teams.state import MemoryBase, TurnState
+
+
+class MockModel(PromptCompletionModel):
+    async def complete_prompt(
+        self,
+        context: TurnContext,
+        memory: MemoryBase,
+        functions: PromptFunctions,
+        tokenizer: Tokenizer,
+        template: PromptTemplate,
+    ) -> PromptResponse[str]:
+        return PromptResponse[str](
+            input=Message(role="user", content="hi"),
+            message=Message(role="assistant", content="hello"),
+        )
+
+
+class TestActionPlanner(IsolatedAsyncioTestCase):
+    def create_mock_context(
+        self, channel_id="channel1", bot_id="bot1", conversation_id="conversation1", user_id="user1"
+    ):
+        context = mock.MagicMock()
+        context.activity.channel_id = channel_id
+        context.activity.recipient.id = bot_id
+        context.activity.conversation.id = conversation_id
+        context.activity.from_property.id = user_id
+        return context
+
+    def setUp(self):
+        self.prompts = PromptManager(PromptManagerOptions(prompts_folder=""))
+        self.prompts.add_prompt(
+            PromptTemplate(
+                name="default",
+                prompt=TextSection(text="this is a test prompt", role="system"),
+                config=PromptTemplateConfig(
+                    schema=1.0,
+                    type="completion",
+                    description="test",
+                    completion=CompletionConfig(completion_type="chat"),
+                ),
+            )
+        )
+        self.planner = ActionPlanner[TurnState](
+            ActionPlannerOptions(model=MockModel(), prompts=self.prompts)
+        )
+
+    async def test_continue_task(self):
+        context = self.create_mock_context()
+        state = await TurnState.load(context)
+        plan = await self.planner.continue_task(context, state)
+
+        self.assertEqual(len(plan.commands), 1)
+        self.assertEqual(plan.commands[0].type, "SAY")
+
+    async def test_complete_prompt_reuses_client(self):
+        context = self.create_mock_context()
+        state = await TurnState.load(context)
+        validator = DefaultResponseValidator()
+
+        await self.planner.complete_prompt(context, state, "default", validator)
+        client = self.planner._clients["default"]
+        await self.planner.complete_prompt(context, state, "default", validator)
+        self.assertIs(self.planner._clients["default"], client)
+
+        await self.planner.complete_prompt(context, state, "default", DefaultResponseValidator())
+        self.assertIsNot(self.planner._clients["default"], client)
+
+    async def test_complete_prompt_rebuilds_client_when_model_changes(self):
+        context = self.create_mock_context()
+        state = await TurnState.load(context)
+        validator = DefaultResponseValidator()
+
+        await self.planner.complete_prompt(context, state, "default", validator)
+        model = MockModel()
+        self.planner.options.model = model
+        await self.planner.complete_prompt(context, state, "default", validator)
+        self.assertIs(self.planner._clients["default"].options.model, model)
@@ -0,0 +1,91 @@
+"""
+Copyright (c) Microsoft Corporation. All rights reserved.
+Licensed under the MIT License.
+"""
+
+from unittest import TestCase
+
+from teams.ai.prompts import (
+    Citation,
+    FunctionCall,
+    ImageContentPart,
+    ImageUrl,
+    Message,
+    MessageContext,
+    TextContentPart,
+)
+
+
+class TestMessage(TestCase):
+    def setUp(self) -> None:
+        self.data = {
+            "role": "assistant",
+            "content": "hello",
+            "context": {
+                "citations": [
+                    {"content": "content", "title": "title", "url": None, "filepath": None}
+                ],
+                "intent": "intent",
+            },
+            "function_call": {"name": "test", "arguments": "{}"},
+            "name": None,
+        }
+
+    def test_from_dict(self):
+        message = Message.from_dict(self.data)
+        self.assertEqual(message.role, "assistant")
+        self.assertEqual(message.content, "hello")
+        self.assertEqual(
+            message.context,
+            MessageContext(
+                citations=[Citation(content="content", title="title", url=None, filepath=None)],
+                intent="intent",
+            ),
+        )
+        self.assertEqual(message.function_call, FunctionCall(name="test", arguments="{}"))
+        self.assertIsNone(message.name)
+
+    def test_from_dict_missing_role(self):
+        with self.assertRaises(KeyError):
+            Message.from_dict({"content": "hello"})
+
+        self.assertIsNone(Message.from_dict({"content": "hello"}, infer_missing=True).role)
+
+    def test_from_dict_missing_function_call_arguments(self):
+        data = {"role": "assistant", "function_call": {"name": "test"}}
+
+        with self.assertRaises(KeyError):
+            Message.from_dict(data)
+
+        self.assertEqual(
+            Message.from_dict(data, infer_missing=True).function_call,
+            FunctionCall(name="test", arguments=None),
+        )
+
+    def test_to_dict(self):
+        self.assertEqual(Message.from_dict(self.data).to_dict(), self.data)
+        self.assertEqual(
+            Message(role="user").to_dict(),
+            {"role": "user", "content": None, "context": None, "function_call": None, "name": None},
+        )
+
+    def test_to_dict_with_content_parts(self):
+        message = Message(role="user", content=[TextContentPart(type="text", text="hello")])
+        self.assertEqual(message.to_dict()["content"], [{"type": "text", "text": "hello"}])
+
+    def test_json_round_trip(self):
+        message = Message.from_dict(self.data)
+        self.assertEqual(Message.from_json(message.to_json()), message)
+
+
+class TestImageContentPart(TestCase):
+    def test_url_string_is_normalized(self):
+        part = ImageContentPart(
+            type="image_url", image_url="https://www.microsoft.com"  # type: ignore[arg-type]
+        )
+        self.assertEqual(part.image_url, ImageUrl(url="https://www.microsoft.com"))
+
+    def test_image_url_is_kept(self):
+        image_url = ImageUrl(url="https://www.microsoft.com")
+        part = ImageContentPart(type="image_url", image_url=image_url)
+        self.assertIs(part.image_url, image_url)
@@ -12,6 +12,7 @@ from botbuilder.core import TurnContext
 from teams.ai.prompts import (
     FunctionCall,
     ImageContentPart,
+    ImageUrl,
     Message,
     PromptFunctions,
     PromptSectionBase,
@@ -163,7 +164,7 @@ class TestPromptSectionBase(IsolatedAsyncioTestCase):
                 [
                     TextContentPart("text", "Hello"),
                     TextContentPart("text", "World!"),
-                    ImageContentPart("image_url", "https://www.microsoft.com"),
+                    ImageContentPart("image_url", ImageUrl("https://www.microsoft.com")),
                 ],
             )
         )
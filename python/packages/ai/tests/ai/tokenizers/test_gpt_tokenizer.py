@@ -27,3 +27,9 @@ class TestGPTTokenizer(unittest.TestCase):
         self.assertEqual(
             result, expected_result, "Expected result does not match the decoded result"
         )
+
+    def test_encode_returns_a_copy_of_cached_tokens(self):
+        text = "tiktoken is great!"
+        result = self.tokenizer.encode(text)
+        result.append(0)
+        self.assertEqual(self.tokenizer.encode(text), [83, 1609, 5963, 374, 2294, 0])
@@ -4,9 +4,10 @@ Licensed under the MIT License.
 """
 
 from typing import cast
-from unittest import IsolatedAsyncioTestCase
+from unittest import IsolatedAsyncioTestCase, mock
 
 from botbuilder.core import TurnContext
+from jsonschema.validators import validator_for
 
 from teams.ai.models import ChatCompletionAction, PromptResponse
 from teams.ai.prompts import FunctionCall, Message
@@ -170,3 +171,71 @@ class TestActionResponseValidator(IsolatedAsyncioTestCase):
             res.value,
             ValidatedChatCompletionAction(name="test", parameters={"name": "test", "age": 10}),
         )
+
+    async def test_should_compile_action_schema_once(self):
+        validator = ActionResponseValidator(
+            actions=[
+                ChatCompletionAction(
+                    name="test",
+                    parameters={
+                        "type": "object",
+                        "properties": {"name": {"type": "string"}},
+                        "required": ["name"],
+                    },
+                )
+            ],
+            required=True,
+        )
+
+        message = Message(
+            role="assistant",
+            function_call=FunctionCall(name="test", arguments='{ "name": "test" }'),
+        )
+
+        with mock.patch(
+            "teams.ai.validators.json_response_validator.validator_for",
+            wraps=validator_for,
+        ) as mock_validator_for:
+            for _ in range(2):
+                res = await validator.validate_response(
+                    context=cast(TurnContext, {}),
+                    memory=TurnState(),
+                    tokenizer=GPTTokenizer(),
+                    response=PromptResponse(message=message),
+                    remaining_attempts=3,
+                )
+
+                self.assertTrue(res.valid)
+
+        mock_validator_for.assert_called_once()
+
+    async def test_should_not_share_actions_between_instances(self):
+        validator = ActionResponseValidator(actions=[ChatCompletionAction(name="a")], required=True)
+        ActionResponseValidator(
+            actions=[
+                ChatCompletionAction(
+                    name="b",
+                    parameters={
+                        "type": "object",
+                        "properties": {"x": {"type": "number"}},
+                        "required": ["x"],
+                    },
+                )
+            ],
+            required=True,
+        )
+
+        message = Message(
+            role="assistant", function_call=FunctionCall(name="b", arguments='{ "y": 1 }')
+        )
+
+        res = await validator.validate_response(
+            context=cast(TurnContext, {}),
+            memory=TurnState(),
+            tokenizer=GPTTokenizer(),
+            response=PromptResponse(message=message),
+            remaining_attempts=3,
+        )
+
+        self.assertFalse(res.valid)
+        self.assertEqual(res.feedback, 'Unknown action named "b". Specify a valid action name.')
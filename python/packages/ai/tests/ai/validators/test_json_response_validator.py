@@ -44,6 +44,21 @@ class TestJSONResponseValidator(IsolatedAsyncioTestCase):
         self.assertFalse(res.valid)
         self.assertEqual(res.feedback, validator.missing_json_feedback)
 
+    async def test_should_report_missing_json_before_checking_schema(self):
+        validator = JSONResponseValidator(schema={"type": "not-a-type"})
+        response = PromptResponse(message=Message(role="assistant", content=""))
+
+        res = await validator.validate_response(
+            context=cast(TurnContext, {}),
+            memory=TurnState(),
+            tokenizer=GPTTokenizer(),
+            response=response,
+            remaining_attempts=3,
+        )
+
+        self.assertFalse(res.valid)
+        self.assertEqual(res.feedback, validator.missing_json_feedback)
+
     async def test_should_be_invalid_when_invalid_json(self):
         validator = JSONResponseValidator()
         response = PromptResponse(message=Message(role="assistant", content="{]"))